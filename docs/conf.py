@@ -6,14 +6,6 @@
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
-import os
-import sys
-
-# Add the project root directory to sys.path so that Sphinx can import your package.
-sys.path.insert(0, os.path.abspath(".."))
-
-# -- Project information -----------------------------------------------------
-
 project = "loadcfg"
 copyright = "2025, Daniel Korkin"
 author = "Daniel Korkin"
@@ -21,25 +13,21 @@ release = "0.1.1"
 
 # -- General configuration ---------------------------------------------------
 
-# In docs/conf.py, near the list of extensions:
 extensions = [
-    "sphinx.ext.autodoc",  # Automatically document modules and members.
+    "autoapi.extension",  # Document the package by parsing its source (no import needed).
     "sphinx.ext.napoleon",  # Support for Google and NumPy style docstrings.
-    "sphinx.ext.autosummary",  # Generate summary tables.
     "sphinx.ext.viewcode",  # Add links to highlighted source code.
     "sphinx.ext.intersphinx",  # Link to external project documentation.
     "sphinx_copybutton",  # Add a "copy" button to code blocks.
-    "sphinx_autodoc_typehints",  # Automatically include type hints in documentation.
 ]
 
-# Add these two settings:
-autosummary_generate = True  # Auto-generate autosummary pages.
-autodoc_default_options = {
-    "members": True,
-    "undoc-members": True,
-    "private-members": False,
-    "show-inheritance": True,
-}
+autoapi_dirs = ["../loadcfg"]
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+]
+autoapi_add_toctree_entry = False  # The API pages are linked from modules.rst.
 
 # Intersphinx mapping to the Python standard library documentation.
 intersphinx_mapping = {
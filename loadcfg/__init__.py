@@ -8,14 +8,34 @@ validate loaded configurations, and generate example configuration files.
 """
 
 import configparser
+import copy
+import datetime
+import functools
 import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
 from io import StringIO
+from itertools import repeat
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Union
 
 import toml
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup.
+    orjson = None
+
 __all__ = [
     "Config",
+    "LazyConfig",
+    "FrozenConfig",
     "LoadJson",
     "LoadYaml",
     "LoadToml",
@@ -25,6 +45,85 @@ __all__ = [
     "GeneratedConfig",
 ]
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Sentinel for lookups where None is a legitimate value.
+_MISSING = object()
+
+# Example values used by Template.generate(); unknown types map to None.
+_EXAMPLE_VALUES = {
+    int: 0,
+    float: 0.0,
+    str: "example",
+    bool: False,
+    list: [],
+    dict: {},
+}
+
+# Parsed file contents keyed on (parser, frozen, absolute path, mtime, size).
+_PARSE_CACHE_MAXSIZE = 128
+_parse_cache = OrderedDict()
+_parse_cache_stats = {"hits": 0, "misses": 0}
+_parse_cache_lock = threading.Lock()
+
+# Leaf types that are immutable and can be shared between loads of a file.
+_SHAREABLE_LEAF_TYPES = (str, int, float, bool, type(None), bytes, datetime.date)
+
+
+# Value types that never need converting; a container holding only these is copied as-is.
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _fill_config(node, raw: dict, config_type, list_type):
+    """Recursively fill an empty Config with the converted contents of ``raw``.
+
+    Every entry is installed with one ``dict.update``; only when ``raw`` holds
+    something other than scalars are its values walked to convert containers.
+
+    Args:
+        node (Config): The Config to fill.
+        raw (dict): The dictionary to convert.
+        config_type (type): Class used for nested dictionaries.
+        list_type (type): Class used for copies of nested lists.
+    """
+    dict.update(node, raw)
+    if _SCALAR_TYPES.issuperset(map(type, raw.values())):
+        return
+    for key, value in raw.items():
+        if isinstance(value, dict):
+            child = dict.__new__(config_type)
+            _fill_config(child, value, config_type, list_type)
+            dict.__setitem__(node, key, child)
+        elif isinstance(value, list):
+            dict.__setitem__(node, key, _copy_list(value, config_type, list_type))
+
+
+def _copy_list(raw: list, config_type, list_type) -> list:
+    """Copy a list for a Config, converting the containers it holds.
+
+    Args:
+        raw (list): The list to copy.
+        config_type (type): Class used for nested dictionaries.
+        list_type (type): Class used for the copy and for nested lists.
+
+    Returns:
+        list: The converted copy.
+    """
+    if _SCALAR_TYPES.issuperset(map(type, raw)):
+        return list_type(raw)
+    items = []
+    for value in raw:
+        if isinstance(value, dict):
+            child = dict.__new__(config_type)
+            _fill_config(child, value, config_type, list_type)
+            value = child
+        elif isinstance(value, list):
+            value = _copy_list(value, config_type, list_type)
+        items.append(value)
+    return list_type(items)
+
 
 class Config(dict):
     """Configuration object that supports attribute access to dictionary keys.
@@ -37,6 +136,9 @@ class Config(dict):
         print(config.name)  # Output: Alice
     """
 
+    # List class used for copies of nested lists.
+    _list_type = list
+
     def __init__(self, data):
         """Initialize the Config object with a dictionary.
 
@@ -49,25 +151,70 @@ class Config(dict):
         super().__init__()
         if not isinstance(data, dict):
             raise ValueError("Config data must be a dictionary")
-        for key, value in data.items():
-            self[key] = self._convert_value(value)
+        self._populate(data)
+
+    def _populate(self, data: dict):
+        """Fill this Config with the converted contents of ``data``.
 
-    def _convert_value(self, value):
-        """Recursively convert dictionaries (and lists containing dicts)
-        into Config objects.
+        Nested dictionaries become objects of this Config's class and lists are
+        copied (as ``_list_type``) with their dictionaries converted. Each
+        repeated occurrence of a container (e.g. a YAML alias) gets its own
+        copy. Data nested too deeply for recursion, or referring back to itself,
+        is converted by _populate_deep instead.
 
         Args:
-            value: The value to convert.
+            data (dict): Dictionary representing configuration data.
+        """
+        try:
+            _fill_config(self, data, type(self), self._list_type)
+        except RecursionError:
+            dict.clear(self)
+            self._populate_deep(data)
 
-        Returns:
-            The converted value.
+    def _populate_deep(self, data: dict):
+        """Fill this Config like _populate, using a worklist instead of recursion.
+
+        A container that refers back to one still being converted (a recursive
+        YAML alias) reuses that conversion.
+
+        Args:
+            data (dict): Dictionary representing configuration data.
         """
-        if isinstance(value, dict):
-            return Config(value)
-        elif isinstance(value, list):
-            return [self._convert_value(item) for item in value]
-        else:
-            return value
+        config_type = type(self)
+        list_type = self._list_type
+        active = {}
+        stack = [(self, data)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, raw = pop()
+            if node is None:
+                # Exit marker: everything below ``raw`` has been converted.
+                del active[raw]
+                continue
+            active[id(raw)] = node
+            push((None, id(raw)))
+            if isinstance(node, list):
+                setitem = list.__setitem__
+                items = enumerate(raw)
+            else:
+                dict.update(node, raw)
+                setitem = dict.__setitem__
+                items = raw.items()
+            for key, value in items:
+                if isinstance(value, dict):
+                    child = active.get(id(value))
+                    if child is None:
+                        child = dict.__new__(config_type)
+                        push((child, value))
+                    setitem(node, key, child)
+                elif isinstance(value, list):
+                    child = active.get(id(value))
+                    if child is None:
+                        child = list_type(value)
+                        if not _SCALAR_TYPES.issuperset(map(type, value)):
+                            push((child, value))
+                    setitem(node, key, child)
 
     def __getattr__(self, item):
         """Allow attribute access to dictionary keys.
@@ -81,10 +228,10 @@ class Config(dict):
         Raises:
             AttributeError: If the key is not found.
         """
-        try:
-            return self[item]
-        except KeyError:
+        value = dict.get(self, item, _MISSING)
+        if value is _MISSING:
             raise AttributeError(f"'Config' object has no attribute '{item}'")
+        return value
 
     def __setattr__(self, key, value):
         """Allow setting values using attribute syntax.
@@ -95,6 +242,18 @@ class Config(dict):
         """
         self[key] = value
 
+    def to_namespace(self) -> SimpleNamespace:
+        """Return a copy of the configuration built from SimpleNamespace objects.
+
+        Nested dictionaries become SimpleNamespace objects and lists are copied,
+        so attribute access no longer goes through Config.__getattr__. Keys that
+        are not strings are kept in the namespace's ``__dict__``.
+
+        Returns:
+            SimpleNamespace: The converted configuration.
+        """
+        return _to_namespace(self)
+
     def validate(self, template):
         """Validate the configuration against a given template.
 
@@ -109,43 +268,491 @@ class Config(dict):
         template.validate(self)
 
 
-def LoadJson(file_path: str) -> Config:
+def _parse_json(file_path: str):
+    """Read and parse a JSON file, using orjson when it is installed.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        The parsed JSON data.
+    """
+    raw = Path(file_path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN, huge integers), so
+            # let json decide whether the document is really invalid.
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _parse_yaml(file_path: str) -> dict:
+    """Read and parse a YAML file that must contain a top-level dictionary.
+
+    Args:
+        file_path (str): Path to the YAML file.
+
+    Returns:
+        dict: The parsed YAML data.
+
+    Raises:
+        ValueError: If the YAML file does not contain a top-level dictionary.
+    """
+    data = yaml.load(Path(file_path).read_text(encoding="utf-8"), Loader=_YamlLoader)
+    if not isinstance(data, dict):
+        raise ValueError("YAML file must contain a top-level dictionary")
+    return data
+
+
+def _is_shareable(data) -> bool:
+    """Check whether parsed data holds only dicts, lists and immutable scalars.
+
+    Such data can be cached and handed out again, because Config conversion
+    copies every dict and list. Anything else (e.g. a YAML ``!!set``) would be
+    shared with later loads.
+
+    Args:
+        data: The parsed data.
+
+    Returns:
+        bool: True if every leaf value is of an immutable type.
+    """
+    if not isinstance(data, (dict, list)):
+        return isinstance(data, _SHAREABLE_LEAF_TYPES)
+    seen = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        for value in node.values() if isinstance(node, dict) else node:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+            elif not isinstance(value, _SHAREABLE_LEAF_TYPES):
+                return False
+    return True
+
+
+def _load_cached(file_path: str, parser, frozen: bool = False):
+    """Parse a file, reusing the previous result if the file has not changed.
+
+    Entries are keyed on the parser, the absolute path, and the file's
+    modification time and size, so editing the file invalidates its entry.
+    The least recently used entry is evicted once the cache is full. Data with
+    mutable leaf values is deep-copied on every hit instead of being shared.
+
+    Args:
+        file_path (str): Path to the configuration file.
+        parser (callable): Function that reads and parses the file.
+        frozen (bool, optional): Return a FrozenConfig instead of the raw parsed
+            data. Defaults to False.
+
+    Returns:
+        The parsed data (or a FrozenConfig, shared when possible). Callers must
+        not mutate it.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If frozen is set and the file does not contain a dictionary.
+    """
+    st = os.stat(file_path)
+    key = (parser, frozen, os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None:
+            _parse_cache_stats["hits"] += 1
+            _parse_cache.move_to_end(key)
+    if entry is None:
+        data = parser(file_path)
+        shareable = _is_shareable(data)
+        if frozen and shareable:
+            data = FrozenConfig(data)
+        entry = (data, shareable)
+        with _parse_cache_lock:
+            _parse_cache_stats["misses"] += 1
+            _parse_cache[key] = entry
+            if len(_parse_cache) > _PARSE_CACHE_MAXSIZE:
+                _parse_cache.popitem(last=False)
+    data, shareable = entry
+    if shareable:
+        return data
+    data = copy.deepcopy(data)
+    return FrozenConfig(data) if frozen else data
+
+
+def _clear_parse_cache():
+    """Empty the parsed-file cache and reset its hit/miss counters."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+        _parse_cache_stats["hits"] = 0
+        _parse_cache_stats["misses"] = 0
+
+
+class _LazyList(list):
+    """List whose dictionaries have already been wrapped by LazyConfig."""
+
+
+def _lazy_value(value):
+    """Wrap a raw value for storage in a LazyConfig.
+
+    Dictionaries become LazyConfig objects (whose own contents stay raw) and
+    lists are copied into a _LazyList, converting nested lists eagerly.
+
+    Args:
+        value: The raw value.
+
+    Returns:
+        The wrapped value, or the value itself if it needs no wrapping.
+    """
+    if type(value) is dict:
+        return LazyConfig(value)
+    if type(value) is list:
+        return _LazyList(_lazy_value(item) for item in value)
+    return value
+
+
+class LazyConfig(Config):
+    """Config that converts nested values on first access.
+
+    Nested dictionaries are wrapped in LazyConfig (and lists are copied with
+    their dictionaries wrapped) only when they are read through attribute or
+    item access, so sections that are never touched are never converted.
+    Bulk access such as ``items()``, ``values()`` and ``pop()`` returns values
+    as stored, so sections that have not been read yet come back as raw
+    dictionaries and lists.
+
+    Example:
+        config = LazyConfig({'db': {'host': 'localhost'}})
+        print(config.db.host)  # 'db' is converted here.
+    """
+
+    def __init__(self, data):
+        """Initialize the LazyConfig object with a dictionary.
+
+        Args:
+            data (dict): Dictionary representing configuration data.
+
+        Raises:
+            ValueError: If the provided data is not a dictionary.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Config data must be a dictionary")
+        dict.__init__(self, data)
+
+    def __reduce__(self):
+        """Support copy and pickle by rebuilding from the stored values.
+
+        Returns:
+            tuple: The class and a plain dict of the current contents.
+        """
+        return (type(self), (dict(self),))
+
+    def _convert(self, key, value):
+        """Convert a raw dict or list value and store the result in place.
+
+        Plain ``dict`` and ``list`` values are the unconverted ones; converted
+        values are LazyConfig and _LazyList objects, so however a value got
+        into the mapping, it is converted on its first read.
+
+        Args:
+            key: The key the value is stored under.
+            value: The stored value.
+
+        Returns:
+            The converted value.
+        """
+        if type(value) is dict or type(value) is list:
+            value = _lazy_value(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        """Return the value for a key, converting it on first access.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The stored value, with a raw dict or list converted.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        return self._convert(key, dict.__getitem__(self, key))
+
+    def __getattr__(self, item):
+        """Allow attribute access to dictionary keys, converting on first access.
+
+        Args:
+            item (str): The key name.
+
+        Returns:
+            The stored value, with a raw dict or list converted.
+
+        Raises:
+            AttributeError: If the key is not found.
+        """
+        value = dict.get(self, item, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'LazyConfig' object has no attribute '{item}'")
+        return self._convert(item, value)
+
+    def get(self, key, default=None):
+        """Return the value for a key, or a default if it is missing.
+
+        Args:
+            key: The key to look up.
+            default: The value returned, unconverted, when the key is missing.
+
+        Returns:
+            The stored value (converted on first access), or ``default``.
+        """
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        return self._convert(key, value)
+
+
+def _read_only(self, *args, **kwargs):
+    """Reject any attempt to modify a frozen container.
+
+    Raises:
+        TypeError: Always.
+    """
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class _FrozenList(list):
+    """List that rejects modification, used for lists inside a FrozenConfig."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __new__(cls, iterable=()):
+        self = list.__new__(cls)
+        list.__init__(self, iterable)
+        return self
+
+    def __init__(self, iterable=()):
+        # The contents are set once in __new__; calling __init__ again must not change them.
+        pass
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+class FrozenConfig(Config):
+    """Read-only Config that can be shared safely between callers.
+
+    Nested dictionaries are FrozenConfig objects and nested lists reject
+    modification as well. Because nothing can change it, loaders return the
+    same cached instance for an unchanged file instead of rebuilding it.
+
+    Example:
+        config = LoadJson("config.json", frozen=True)
+        config.name = "other"  # Raises TypeError.
+
+    Use ``Config(frozen_config)`` to get a mutable copy.
+    """
+
+    _list_type = _FrozenList
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _read_only
+    update = pop = popitem = clear = setdefault = __ior__ = _read_only
+
+    def __new__(cls, data):
+        """Create the FrozenConfig and fill it with the converted data.
+
+        The contents are set here rather than in __init__, so calling __init__
+        again on a (possibly shared) instance cannot change it.
+
+        Args:
+            data (dict): Dictionary representing configuration data.
+
+        Raises:
+            ValueError: If the provided data is not a dictionary.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Config data must be a dictionary")
+        self = dict.__new__(cls)
+        self._populate(data)
+        return self
+
+    def __init__(self, data):
+        """Do nothing; the contents were already set by __new__."""
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def _namespace(attrs: dict) -> SimpleNamespace:
+    """Create a SimpleNamespace holding the given attributes.
+
+    The namespace's ``__dict__`` is filled directly, so keys that are not valid
+    keyword names (e.g. YAML integer keys) are kept instead of raising.
+
+    Args:
+        attrs (dict): The attributes to store.
+
+    Returns:
+        SimpleNamespace: The new namespace.
+    """
+    namespace = SimpleNamespace()
+    namespace.__dict__.update(attrs)
+    return namespace
+
+
+def _to_namespace(value, active=None):
+    """Recursively convert dictionaries into SimpleNamespace objects.
+
+    A container that refers back to one still being converted (a recursive
+    YAML alias) reuses that conversion instead of recursing forever.
+
+    Args:
+        value: The value to convert.
+        active (dict, optional): Conversions in progress, keyed by the id of
+            their source container.
+
+    Returns:
+        The converted value.
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+    if active is None:
+        active = {}
+    converted = active.get(id(value))
+    if converted is not None:
+        return converted
+    if isinstance(value, dict):
+        converted = active[id(value)] = SimpleNamespace()
+        converted.__dict__.update({key: _to_namespace(item, active) for key, item in value.items()})
+    else:
+        converted = active[id(value)] = []
+        converted.extend(_to_namespace(item, active) for item in value)
+    del active[id(value)]
+    return converted
+
+
+def _template_namespace(template, data: dict) -> SimpleNamespace:
+    """Build a SimpleNamespace for data that has been validated against a template.
+
+    Only fields declared as nested templates become namespaces; every other
+    value is copied as plain data so its declared type is kept.
+
+    Args:
+        template (Type[Template]): The template the data was validated against.
+        data (dict): The validated configuration data.
+
+    Returns:
+        SimpleNamespace: The converted configuration.
+    """
+    nested = {field: expected for field, expected, is_template, _ in template._validation_plan if is_template}
+    attrs = {}
+    for key, value in data.items():
+        sub_template = nested.get(key)
+        if sub_template is not None:
+            value = _template_namespace(sub_template, value)
+        elif isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+        attrs[key] = value
+    return _namespace(attrs)
+
+
+def _load(file_path: str, parser, lazy: bool, frozen: bool, template):
+    """Load a file and wrap it according to the loader options.
+
+    Lazy loads always parse the file; every other option goes through the
+    parse cache.
+
+    Args:
+        file_path (str): Path to the configuration file.
+        parser (callable): Function that reads and parses the file.
+        lazy (bool): Return a LazyConfig.
+        frozen (bool): Return a shared FrozenConfig.
+        template (Type[Template] or None): Validate against this template and
+            return a SimpleNamespace.
+
+    Returns:
+        Config, LazyConfig, FrozenConfig or SimpleNamespace: The loaded configuration.
+
+    Raises:
+        ValueError: If more than one of lazy, frozen and template is given, or
+            the file does not contain a dictionary.
+        ConfigValidationError: If the data does not match the template.
+    """
+    if lazy + frozen + (template is not None) > 1:
+        raise ValueError("'lazy', 'frozen' and 'template' cannot be combined")
+    if frozen:
+        return _load_cached(file_path, parser, frozen=True)
+    if lazy:
+        # LazyConfig keeps the raw nested objects, so they must not come from the cache.
+        return LazyConfig(parser(file_path))
+    data = _load_cached(file_path, parser)
+    if template is not None:
+        if not isinstance(data, dict):
+            raise ValueError("Config data must be a dictionary")
+        template.validate(data)
+        return _template_namespace(template, data)
+    return Config(data)
+
+
+def LoadJson(
+    file_path: str, lazy: bool = False, template=None, frozen: bool = False
+) -> Union[Config, SimpleNamespace]:
     """Load a JSON configuration file and return a Config object.
 
     Args:
         file_path (str): Path to the JSON file.
+        lazy (bool, optional): Return a LazyConfig that converts nested sections
+            on first access. Defaults to False.
+        template (Type[Template], optional): Validate the file against this template
+            and return a SimpleNamespace instead of a Config. Defaults to None.
+        frozen (bool, optional): Return a read-only FrozenConfig. Repeated loads of an
+            unchanged file return the same instance. Defaults to False.
 
     Returns:
-        Config: The loaded configuration as a Config object.
+        Config or SimpleNamespace: The loaded configuration as a Config object (or
+        a LazyConfig, FrozenConfig or SimpleNamespace, depending on the options).
 
     Raises:
         FileNotFoundError: If the file does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
+        ValueError: If the JSON file does not contain a top-level dictionary, or if
+            more than one of lazy, frozen and template is given.
+        ConfigValidationError: If the file does not match the given template.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return Config(data)
+    return _load(file_path, _parse_json, lazy, frozen, template)
 
 
-def LoadYaml(file_path: str) -> Config:
+def LoadYaml(
+    file_path: str, lazy: bool = False, template=None, frozen: bool = False
+) -> Union[Config, SimpleNamespace]:
     """Load a YAML configuration file and return a Config object.
 
     Args:
         file_path (str): Path to the YAML file.
+        lazy (bool, optional): Return a LazyConfig that converts nested sections
+            on first access. Defaults to False.
+        template (Type[Template], optional): Validate the file against this template
+            and return a SimpleNamespace instead of a Config. Defaults to None.
+        frozen (bool, optional): Return a read-only FrozenConfig. Repeated loads of an
+            unchanged file return the same instance. Defaults to False.
 
     Returns:
-        Config: The loaded configuration as a Config object.
+        Config or SimpleNamespace: The loaded configuration as a Config object (or
+        a LazyConfig, FrozenConfig or SimpleNamespace, depending on the options).
 
     Raises:
         FileNotFoundError: If the file does not exist.
         yaml.YAMLError: If the file is not valid YAML.
-        ValueError: If the YAML file does not contain a top-level dictionary.
+        ValueError: If the YAML file does not contain a top-level dictionary, or if
+            more than one of lazy, frozen and template is given.
+        ConfigValidationError: If the file does not match the given template.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not isinstance(data, dict):
-        raise ValueError("YAML file must contain a top-level dictionary")
-    return Config(data)
+    return _load(file_path, _parse_yaml, lazy, frozen, template)
 
 
 def LoadToml(file_path: str) -> Config:
@@ -237,6 +844,153 @@ def _dict_to_ini(data: dict) -> str:
         return stream.getvalue()
 
 
+# Strings that can be written as plain YAML scalars without being re-typed on load.
+_YAML_PLAIN_STR = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+_YAML_RESERVED = frozenset(["y", "n", "yes", "no", "true", "false", "on", "off", "null"])
+
+
+def _yaml_scalar(value) -> str:
+    """Render a scalar as a YAML block-style token.
+
+    Args:
+        value: A str, bool, int, float or None.
+
+    Returns:
+        str: The YAML representation of the value.
+
+    Raises:
+        TypeError: If the value is not a supported scalar.
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is float:
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 only resolves exponent floats that contain a dot.
+        if "." not in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if type(value) is str:
+        if _YAML_PLAIN_STR.match(value) and value.lower() not in _YAML_RESERVED:
+            return value
+        # A JSON string is also a valid double-quoted YAML scalar.
+        return json.dumps(value)
+    raise TypeError(f"Cannot emit {type(value).__name__} as YAML")
+
+
+def _yaml_block(value, indent: str, lines: list):
+    """Append the block-style YAML lines for a dict or list to ``lines``.
+
+    Args:
+        value (dict or list): The non-empty container to emit.
+        indent (str): Indentation prefix for this level.
+        lines (list): Output lines.
+    """
+    if type(value) is dict:
+        for key in sorted(value):
+            item = value[key]
+            prefix = f"{indent}{_yaml_scalar(key)}:"
+            if type(item) is dict and item:
+                lines.append(prefix)
+                _yaml_block(item, indent + "  ", lines)
+            elif type(item) is list and item:
+                lines.append(prefix)
+                _yaml_block(item, indent, lines)
+            else:
+                lines.append(f"{prefix} {_yaml_inline(item)}")
+    else:
+        for item in value:
+            if type(item) in (dict, list) and item:
+                sub = []
+                _yaml_block(item, indent + "  ", sub)
+                lines.append(f"{indent}- {sub[0][len(indent) + 2:]}")
+                lines.extend(sub[1:])
+            else:
+                lines.append(f"{indent}- {_yaml_inline(item)}")
+
+
+def _yaml_inline(value) -> str:
+    """Render a scalar or an empty container on a single line.
+
+    Args:
+        value: The value to render.
+
+    Returns:
+        str: The YAML representation of the value.
+    """
+    if type(value) is dict and not value:
+        return "{}"
+    if type(value) is list and not value:
+        return "[]"
+    return _yaml_scalar(value)
+
+
+def _fast_yaml_dump(data: dict) -> str:
+    """Emit block-style YAML for the plain data produced by Template examples.
+
+    Only dicts, lists, str, int, float, bool and None are handled, which is all
+    _generate_example_dict() produces. Anything else is passed to PyYAML. Used
+    when PyYAML lacks libyaml, where its pure-Python dumper is slow.
+
+    Args:
+        data (dict): The data to emit.
+
+    Returns:
+        str: The YAML document.
+    """
+    if not data:
+        return "{}\n"
+    lines = []
+    try:
+        _yaml_block(data, "", lines)
+    except TypeError:
+        return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False)
+    lines.append("")
+    return "\n".join(lines)
+
+
+if hasattr(yaml, "CSafeDumper"):
+    _dump_yaml = functools.partial(yaml.dump, Dumper=_YamlDumper, default_flow_style=False)
+else:  # pragma: no cover - depends on how PyYAML was built.
+    _dump_yaml = _fast_yaml_dump
+
+
+def _dump_json(data) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed.
+
+    orjson only supports two-space indentation, so the layout differs slightly
+    between the two paths; the parsed content is identical.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=4)
+
+
+# Serializers used by Template.generate(), keyed on the lower-cased format name.
+_FORMATTERS = {
+    "json": _dump_json,
+    "yaml": _dump_yaml,
+    "yml": _dump_yaml,
+    "toml": toml.dumps,
+    "ini": _dict_to_ini,
+}
+
+
 class GeneratedConfig:
     """Wrapper for generated configuration content that adds a .save() method.
 
@@ -298,12 +1052,18 @@ class Template:
         not start with an underscore.
         """
         super().__init_subclass__()
-        if hasattr(cls, "__annotations__") and cls.__annotations__:
-            cls._fields = cls.__annotations__
+        annotations = getattr(cls, "__annotations__", None)
+        if annotations:
+            fields = annotations.items()
         else:
-            cls._fields = {
-                k: type(v) for k, v in cls.__dict__.items() if not k.startswith("_") and not callable(v)
-            }
+            # Only templates without annotations pay for scanning the class namespace.
+            fields = ((k, type(v)) for k, v in vars(cls).items() if not k.startswith("_") and not callable(v))
+        cls._fields = {sys.intern(k): v for k, v in fields}
+        # Resolve each field's checks once so validate() is a flat loop.
+        cls._validation_plan = tuple(
+            _plan_entry(field, expected_type) for field, expected_type in cls._fields.items()
+        )
+        cls._validate_fast = staticmethod(_compile_validator(cls._validation_plan))
 
     @classmethod
     def validate(cls, config: Config):
@@ -312,6 +1072,9 @@ class Template:
         This method checks that all required fields are present in the config and
         that the types of the provided values match the expected types. If a field’s
         expected type is a subclass of Template, the validation is performed recursively.
+        Plain dictionaries, LazyConfig objects and SimpleNamespace objects (as built by
+        to_namespace() or a template load) are accepted as well. Fields typed as ``dict``
+        still require a dict value.
 
         Args:
             config (Config): The configuration object to validate.
@@ -320,21 +1083,25 @@ class Template:
             ConfigValidationError: If a required field is missing or if a field has an
                                    incorrect type.
         """
-        for field, expected_type in cls._fields.items():
-            if not hasattr(config, field):
-                raise ConfigValidationError(f"Missing required field: '{field}'")
-            value = getattr(config, field)
-            if isinstance(expected_type, type) and issubclass(expected_type, Template):
-                try:
-                    expected_type.validate(value)
-                except ConfigValidationError as e:
-                    raise ConfigValidationError(f"In field '{field}': {str(e)}")
-            else:
-                if not isinstance(value, expected_type):
-                    raise ConfigValidationError(
-                        f"Field '{field}' expected type '{expected_type.__name__}', "
-                        f"got '{type(value).__name__}'"
-                    )
+        if isinstance(config, SimpleNamespace):
+            config = vars(config)
+        cls._validate_fast(config)
+
+    @classmethod
+    def validate_raw(cls, data: dict):
+        """Validate a plain dictionary against the template.
+
+        Validation only needs membership tests and item lookups, so it can run
+        on freshly parsed data before (or instead of) wrapping it in a Config.
+
+        Args:
+            data (dict): The raw configuration data to validate.
+
+        Raises:
+            ConfigValidationError: If a required field is missing or if a field has an
+                                   incorrect type.
+        """
+        cls.validate(data)
 
     @classmethod
     def generate(cls, fmt: str = "json") -> GeneratedConfig:
@@ -354,19 +1121,8 @@ class Template:
         Raises:
             ValueError: If the specified format is unsupported.
         """
-        example_dict = cls._generate_example_dict()
         fmt_lower = fmt.lower()
-        if fmt_lower == "json":
-            content = json.dumps(example_dict, indent=4)
-        elif fmt_lower in ("yaml", "yml"):
-            content = yaml.dump(example_dict, default_flow_style=False)
-        elif fmt_lower == "toml":
-            content = toml.dumps(example_dict)
-        elif fmt_lower == "ini":
-            content = _dict_to_ini(example_dict)
-        else:
-            raise ValueError("Unsupported format. Use 'json', 'yaml', 'toml', or 'ini'.")
-        return GeneratedConfig(content, fmt_lower)
+        return GeneratedConfig(_generate_content(cls, fmt_lower), fmt_lower)
 
     @classmethod
     def _generate_example_dict(cls) -> dict:
@@ -376,34 +1132,118 @@ class Template:
             dict: Dictionary containing example configuration values.
         """
         example = {}
-        for field, expected_type in cls._fields.items():
-            if isinstance(expected_type, type) and issubclass(expected_type, Template):
+        for field, expected_type, is_template, _ in cls._validation_plan:
+            if is_template:
                 example[field] = expected_type._generate_example_dict()
             else:
-                example[field] = _get_example_value(expected_type)
+                value = _EXAMPLE_VALUES.get(expected_type)
+                # Hand out fresh containers so the YAML dumper never emits aliases.
+                example[field] = value.copy() if isinstance(value, (list, dict)) else value
         return example
 
 
-def _get_example_value(expected_type):
-    """Return an example value for a given expected type.
+def _plan_entry(field: str, expected_type) -> tuple:
+    """Resolve how a single template field is validated.
+
+    ``list[T]`` and ``typing.List[T]`` annotations are split into a list check
+    plus an item type, as long as ``T`` is a plain (non-Template) class.
 
     Args:
-        expected_type (type): The expected type.
+        field (str): The field name.
+        expected_type: The field's annotation or inferred type.
 
     Returns:
-        An example value corresponding to the type.
+        tuple: (field, expected_type, is_template, item_type), where item_type is
+        None when list items are not checked.
     """
-    if expected_type is int:
-        return 0
-    elif expected_type is float:
-        return 0.0
-    elif expected_type is str:
-        return "example"
-    elif expected_type is bool:
-        return False
-    elif expected_type is list:
-        return []
-    elif expected_type is dict:
-        return {}
-    else:
-        return None
+    item_type = None
+    if getattr(expected_type, "__origin__", None) is list:
+        args = getattr(expected_type, "__args__", None) or ()
+        expected_type = list
+        if len(args) == 1 and isinstance(args[0], type) and not issubclass(args[0], Template):
+            item_type = args[0]
+    is_template = isinstance(expected_type, type) and issubclass(expected_type, Template)
+    return (field, expected_type, is_template, item_type)
+
+
+def _compile_validator(plan):
+    """Build a validation function specialized for a template's fields.
+
+    The checks for every field are emitted as straight-line source and
+    compiled once with exec, so validating a config runs no per-field loop
+    or branch on the kind of expected type.
+
+    Args:
+        plan (tuple): The template's validation plan, as
+            (field, expected_type, is_template, item_type) tuples.
+
+    Returns:
+        callable: A function that takes a config dictionary and raises
+        ConfigValidationError if it does not match the template.
+    """
+    namespace = {
+        "ConfigValidationError": ConfigValidationError,
+        "SimpleNamespace": SimpleNamespace,
+        "repeat": repeat,
+    }
+    lines = ["def _validate(config):"]
+    for i, (field, expected_type, is_template, item_type) in enumerate(plan):
+        type_name = f"_t{i}"
+        namespace[type_name] = expected_type
+        type_label = getattr(expected_type, "__name__", repr(expected_type))
+        missing = f"Missing required field: '{field}'"
+        wrong_type = f"Field '{field}' expected type '{type_label}', got '"
+        nested = f"In field '{field}': "
+        lines.append(f"    if {field!r} not in config:")
+        lines.append(f"        raise ConfigValidationError({missing!r})")
+        lines.append(f"    value = config[{field!r}]")
+        if is_template:
+            lines.append("    if isinstance(value, SimpleNamespace):")
+            lines.append("        value = value.__dict__")
+            lines.append("    if not isinstance(value, dict):")
+            lines.append(f'        raise ConfigValidationError({wrong_type!r} + type(value).__name__ + "\'")')
+            lines.append("    try:")
+            lines.append(f"        {type_name}._validate_fast(value)")
+            lines.append("    except ConfigValidationError as e:")
+            lines.append(f"        raise ConfigValidationError({nested!r} + str(e))")
+        else:
+            lines.append(f"    if not isinstance(value, {type_name}):")
+            lines.append(f'        raise ConfigValidationError({wrong_type!r} + type(value).__name__ + "\'")')
+            if item_type is not None:
+                item_name = f"_i{i}"
+                namespace[item_name] = item_type
+                wrong_item = f"Field '{field}' expected items of type '{item_type.__name__}', got '"
+                # map/all/repeat keep the per-item isinstance loop in C.
+                lines.append(f"    if not all(map(isinstance, value, repeat({item_name}))):")
+                lines.append(
+                    f"        bad = next(item for item in value if not isinstance(item, {item_name}))"
+                )
+                lines.append(
+                    f'        raise ConfigValidationError({wrong_item!r} + type(bad).__name__ + "\'")'
+                )
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["_validate"]
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_content(template, fmt: str) -> str:
+    """Render the example configuration for a template in the given format.
+
+    The output only depends on the template class and the format, so it is
+    computed once per pair and reused by later Template.generate() calls.
+
+    Args:
+        template (Type[Template]): The Template class to render.
+        fmt (str): Lower-cased output format.
+
+    Returns:
+        str: The rendered configuration.
+
+    Raises:
+        ValueError: If the specified format is unsupported.
+    """
+    formatter = _FORMATTERS.get(fmt)
+    if formatter is None:
+        raise ValueError("Unsupported format. Use 'json', 'yaml', 'toml', or 'ini'.")
+    return formatter(template._generate_example_dict())
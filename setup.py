@@ -32,6 +32,9 @@ setup(
         "toml>=0.10.2",
     ],
     extras_require={
+        "fast": [
+            "orjson",  # Optional faster JSON parsing.
+        ],
         "dev": [
             "pytest",
             "pre-commit",
@@ -41,7 +44,7 @@ setup(
             "yamllint",
             "pytest-cov",
             "codecov",
-        ]
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -1,6 +1,7 @@
 import configparser
 import json
 import os
+import typing
 
 import pytest
 import toml
@@ -9,6 +10,8 @@ import yaml
 from loadcfg import (
     Config,
     ConfigValidationError,
+    FrozenConfig,
+    LazyConfig,
     LoadIni,
     LoadJson,
     LoadToml,
@@ -39,6 +42,11 @@ def test_config_getattr_error():
         _ = config.non_existent
 
 
+def test_config_getattr_none_value():
+    config = Config({"a": None})
+    assert config.a is None
+
+
 def test_config_list_conversion():
     data = {"list": [{"key": "value"}]}
     config = Config(data)
@@ -47,6 +55,28 @@ def test_config_list_conversion():
     assert config.list[0].key == "value"
 
 
+def test_config_scalar_list_is_copied():
+    items = [1, "two", 3.0, None]
+    config = Config({"items": items})
+    assert config["items"] == items
+    assert config["items"] is not items
+
+
+def test_config_mixed_list_conversion():
+    config = Config({"items": [1, {"key": "value"}, [{"inner": 2}]]})
+    assert config["items"][0] == 1
+    assert config["items"][1].key == "value"
+    assert config["items"][2][0].inner == 2
+
+
+def test_config_non_string_keys():
+    config = Config({1: {"a": [1, {2: 3}]}, "b": True})
+    assert isinstance(config[1], Config)
+    assert isinstance(config[1].a[1], Config)
+    assert config[1].a[1][2] == 3
+    assert config.b is True
+
+
 def test_config_invalid_data():
     with pytest.raises(ValueError) as exc_info:
         Config("not a dict")
@@ -72,6 +102,15 @@ def test_load_json_invalid(tmp_path):
         _ = LoadJson(str(file_path))
 
 
+@pytest.mark.parametrize("content", ["5", "true", "null", '"abc"'])
+def test_load_json_scalar_top_level(tmp_path, content):
+    file_path = tmp_path / "scalar.json"
+    file_path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError) as exc_info:
+        _ = LoadJson(str(file_path))
+    assert "Config data must be a dictionary" in str(exc_info.value)
+
+
 def test_load_json_file_not_found(tmp_path):
     file_path = tmp_path / "nonexistent.json"
     with pytest.raises(FileNotFoundError):
@@ -262,6 +301,48 @@ def test_template_nested_validate_failure():
     assert "expected type 'int'" in str(exc_info.value)
 
 
+def test_template_nested_validate_not_a_mapping():
+    config = Config({"name": "Parent", "nested": "value"})
+    with pytest.raises(ConfigValidationError) as exc_info:
+        ParentTemplate.validate(config)
+    assert "Field 'nested' expected type 'NestedTemplate', got 'str'" in str(exc_info.value)
+
+
+def test_template_compiled_validator_escapes_field_names():
+    from loadcfg import _compile_validator
+
+    validator = _compile_validator((("it's {odd}", int, False, None), ('say "hi"', str, False, None)))
+    validator({"it's {odd}": 1, 'say "hi"': "hi"})
+    with pytest.raises(ConfigValidationError) as exc_info:
+        validator({"it's {odd}": "x", 'say "hi"': "hi"})
+    assert str(exc_info.value) == "Field 'it's {odd}' expected type 'int', got 'str'"
+    with pytest.raises(ConfigValidationError) as exc_info:
+        validator({})
+    assert str(exc_info.value) == "Missing required field: 'it's {odd}'"
+
+
+class ListTemplate(Template):
+    ports: list[int]
+    names: typing.List[str]
+    anything: list
+
+
+def test_template_validate_list_items():
+    ListTemplate.validate(Config({"ports": [80, 443], "names": ["a"], "anything": [1, "x"]}))
+    ListTemplate.validate(Config({"ports": [], "names": [], "anything": []}))
+    with pytest.raises(ConfigValidationError) as exc_info:
+        ListTemplate.validate(Config({"ports": [80, "443"], "names": [], "anything": []}))
+    assert "Field 'ports' expected items of type 'int', got 'str'" in str(exc_info.value)
+    with pytest.raises(ConfigValidationError) as exc_info:
+        ListTemplate.validate(Config({"ports": [80], "names": "abc", "anything": []}))
+    assert "Field 'names' expected type 'list', got 'str'" in str(exc_info.value)
+
+
+def test_template_generate_list_items():
+    data = json.loads(str(ListTemplate.generate(fmt="json")))
+    assert data == {"ports": [], "names": [], "anything": []}
+
+
 def test_template_generate_json():
     generated = DummyTemplate.generate(fmt="json")
     data = json.loads(str(generated))
@@ -271,6 +352,14 @@ def test_template_generate_json():
     assert data["age"] == 0
 
 
+def test_template_generate_json_without_orjson(monkeypatch):
+    import loadcfg
+
+    monkeypatch.setattr(loadcfg, "orjson", None)
+    content = loadcfg._dump_json({"name": "example", "nested": {"value": 0}})
+    assert content == json.dumps({"name": "example", "nested": {"value": 0}}, indent=4)
+
+
 def test_template_generate_yaml():
     generated = DummyTemplate.generate(fmt="yaml")
     data = yaml.safe_load(str(generated))
@@ -297,6 +386,17 @@ def test_template_generate_ini():
     assert "example" in default_values or "0" in default_values
 
 
+def test_template_generate_is_cached():
+    from loadcfg import _generate_content
+
+    first = DummyTemplate.generate(fmt="YAML")
+    hits = _generate_content.cache_info().hits
+    second = DummyTemplate.generate(fmt="yaml")
+    assert _generate_content.cache_info().hits == hits + 1
+    assert first is not second
+    assert first.content == second.content
+
+
 def test_template_generate_invalid_format():
     with pytest.raises(ValueError):
         DummyTemplate.generate(fmt="xml")
@@ -349,6 +449,39 @@ def test_all_types_template_generate():
     assert data["unknown_field"] is None
 
 
+class TwoListsTemplate(Template):
+    first: list
+    second: list
+
+
+def test_template_generate_yaml_no_aliases():
+    content = str(TwoListsTemplate.generate(fmt="yaml"))
+    assert "&" not in content
+    assert yaml.safe_load(content) == {"first": [], "second": []}
+
+
+def test_fast_yaml_dump_all_types():
+    from loadcfg import _fast_yaml_dump
+
+    example = AllTypesTemplate._generate_example_dict()
+    content = _fast_yaml_dump(example)
+    assert content == yaml.dump(example, default_flow_style=False)
+    assert yaml.safe_load(content) == example
+
+
+def test_fast_yaml_dump_nested_and_quoted():
+    from loadcfg import _fast_yaml_dump
+
+    data = {
+        "nested": {"inner": {"value": 1}, "items": [1, "two", {"k": "v"}, [3]]},
+        "words": ["yes", "Off", "null", "a: b", "", "1.5", "caf\u00e9"],
+        "floats": [1e20, -0.5, float("inf")],
+        "empty": [[], {}],
+    }
+    assert yaml.safe_load(_fast_yaml_dump(data)) == data
+    assert _fast_yaml_dump({}) == "{}\n"
+
+
 # === Tests for GeneratedConfig .save() feature ===
 
 
@@ -398,3 +531,366 @@ def test_load_toml_returns_non_dict(monkeypatch, tmp_path):
     with pytest.raises(ValueError) as exc_info:
         _ = LoadToml(str(file_path))
     assert "TOML file must contain a top-level table" in str(exc_info.value)
+
+
+# === Tests for the parsed-file cache ===
+
+
+def test_load_json_uses_parse_cache(tmp_path):
+    from loadcfg import _clear_parse_cache, _parse_cache_stats
+
+    _clear_parse_cache()
+    file_path = tmp_path / "cached.json"
+    file_path.write_text(json.dumps({"name": "Cached", "items": [1, 2]}), encoding="utf-8")
+    first = LoadJson(str(file_path))
+    first.name = "Changed"
+    first["items"].append(3)
+    second = LoadJson(str(file_path))
+    assert _parse_cache_stats == {"hits": 1, "misses": 1}
+    # Mutating a returned Config must not leak into later loads.
+    assert second.name == "Cached"
+    assert second["items"] == [1, 2]
+
+
+def test_load_yaml_parse_cache_invalidated_on_change(tmp_path):
+    from loadcfg import _clear_parse_cache, _parse_cache_stats
+
+    _clear_parse_cache()
+    file_path = tmp_path / "cached.yaml"
+    file_path.write_text(yaml.dump({"value": 1}), encoding="utf-8")
+    assert LoadYaml(str(file_path)).value == 1
+    file_path.write_text(yaml.dump({"value": 12345}), encoding="utf-8")
+    assert LoadYaml(str(file_path)).value == 12345
+    assert _parse_cache_stats["misses"] == 2
+
+
+def test_load_yaml_cache_does_not_share_mutable_leaves(tmp_path):
+    file_path = tmp_path / "set.yaml"
+    file_path.write_text("s: !!set {a: null}\n", encoding="utf-8")
+    LoadYaml(str(file_path)).s.add("b")
+    assert LoadYaml(str(file_path)).s == {"a"}
+    LoadYaml(str(file_path), frozen=True).s.add("c")
+    assert LoadYaml(str(file_path), frozen=True).s == {"a"}
+
+
+def test_parse_cache_is_thread_safe(tmp_path, monkeypatch):
+    import threading
+
+    import loadcfg
+
+    loadcfg._clear_parse_cache()
+    monkeypatch.setattr(loadcfg, "_PARSE_CACHE_MAXSIZE", 2)
+    paths = []
+    for i in range(4):
+        file_path = tmp_path / f"thread{i}.json"
+        file_path.write_text(json.dumps({"i": i}), encoding="utf-8")
+        paths.append(str(file_path))
+    errors = []
+
+    def worker(offset):
+        try:
+            for n in range(200):
+                path = paths[(n + offset) % len(paths)]
+                assert LoadJson(path).i == paths.index(path)
+        except Exception as exc:  # pragma: no cover - only on failure.
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_parse_cache_evicts_oldest(tmp_path, monkeypatch):
+    import loadcfg
+
+    loadcfg._clear_parse_cache()
+    monkeypatch.setattr(loadcfg, "_PARSE_CACHE_MAXSIZE", 2)
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"config{i}.json"
+        file_path.write_text(json.dumps({"i": i}), encoding="utf-8")
+        paths.append(str(file_path))
+        LoadJson(paths[-1])
+    assert len(loadcfg._parse_cache) == 2
+    LoadJson(paths[0])
+    assert loadcfg._parse_cache_stats["misses"] == 4
+
+
+def test_load_json_accepts_stdlib_only_values(tmp_path):
+    file_path = tmp_path / "nan.json"
+    file_path.write_text('{"ratio": NaN, "big": 123456789012345678901234567890}', encoding="utf-8")
+    config = LoadJson(str(file_path))
+    assert config.ratio != config.ratio
+    assert config.big == 123456789012345678901234567890
+
+
+def test_config_deeply_nested_conversion():
+    data = {"leaf": 1}
+    for depth in range(5000):
+        data = {"child": data, "items": [{"depth": depth}]}
+    config = Config(data)
+    node = config
+    for depth in reversed(range(5000)):
+        assert node["items"][0].depth == depth
+        node = node.child
+    assert node.leaf == 1
+
+
+def test_config_recursive_yaml_alias(tmp_path):
+    file_path = tmp_path / "recursive.yaml"
+    file_path.write_text("node: &a\n  self: *a\n", encoding="utf-8")
+    config = LoadYaml(str(file_path))
+    assert config.node.self is config.node
+
+
+def test_config_yaml_aliases_are_independent(tmp_path):
+    file_path = tmp_path / "aliases.yaml"
+    file_path.write_text(
+        "defaults: &d\n  timeout: 5\n  hosts: &h [a]\nprod: *d\nextra: *h\n", encoding="utf-8"
+    )
+    config = LoadYaml(str(file_path))
+    config.prod.timeout = 99
+    config.prod.hosts.append("b")
+    assert config.defaults.timeout == 5
+    assert config.defaults.hosts == ["a"]
+    assert config.extra == ["a"]
+
+
+# === Tests for lazy loading and raw validation ===
+
+
+def test_lazy_config_converts_on_access():
+    raw = {"name": "Lazy", "db": {"host": "localhost"}, "items": [{"key": 1}, 2]}
+    config = LazyConfig(raw)
+    assert type(dict.__getitem__(config, "db")) is dict
+    db = config.db
+    assert isinstance(db, LazyConfig)
+    assert db.host == "localhost"
+    assert config.db is db
+    assert config["items"][0].key == 1
+    assert config.get("items")[1] == 2
+    assert config.get("missing", 5) == 5
+    assert raw["db"] == {"host": "localhost"}
+
+
+def test_lazy_config_getattr_error_and_set():
+    config = LazyConfig({"a": 1})
+    with pytest.raises(AttributeError):
+        _ = config.missing
+    config.b = {"c": 3}
+    assert config.b.c == 3
+    with pytest.raises(ValueError):
+        LazyConfig([1])
+
+
+def test_lazy_config_converts_values_added_later():
+    config = LazyConfig({"db": {"host": "a"}})
+    assert config.db.host == "a"
+    config.update(db={"host": "b"})
+    assert config.db.host == "b"
+    config.setdefault("cache", {"size": 1})
+    assert config.cache.size == 1
+    config |= {"db": {"host": "c"}}
+    assert config["db"].host == "c"
+
+
+def test_lazy_config_nested_lists():
+    config = LazyConfig({"matrix": [[{"a": 1}], [2]]})
+    assert config.matrix[0][0].a == 1
+    assert config.matrix[1] == [2]
+
+
+def test_lazy_config_pickle_and_copy():
+    import copy
+    import pickle
+
+    config = LazyConfig({"a": 1, "db": {"host": "h"}})
+    config.db
+    restored = pickle.loads(pickle.dumps(config))
+    assert isinstance(restored, LazyConfig)
+    assert restored.db.host == "h"
+    assert copy.deepcopy(config).db.host == "h"
+
+
+def test_load_json_lazy_does_not_touch_cache(tmp_path):
+    file_path = tmp_path / "lazy_cache.json"
+    file_path.write_text(json.dumps({"db": {"host": "h"}, "matrix": [[1], [2]]}), encoding="utf-8")
+    LoadJson(str(file_path))
+    for _, value in LoadJson(str(file_path), lazy=True).items():
+        if isinstance(value, dict):
+            value["host"] = "POISON"
+    LoadJson(str(file_path), lazy=True).matrix[1].append(99)
+    config = LoadJson(str(file_path))
+    assert config.db.host == "h"
+    assert config.matrix[1] == [2]
+
+
+def test_load_json_lazy(tmp_path):
+    file_path = tmp_path / "lazy.json"
+    file_path.write_text(json.dumps({"name": "Parent", "nested": {"value": 10}}), encoding="utf-8")
+    config = LoadJson(str(file_path), lazy=True)
+    assert isinstance(config, LazyConfig)
+    ParentTemplate.validate(config)
+    config.nested.value = 11
+    assert LoadJson(str(file_path)).nested.value == 10
+
+
+def test_load_yaml_lazy(tmp_path):
+    file_path = tmp_path / "lazy.yaml"
+    file_path.write_text(yaml.dump({"section": {"key": "value"}}), encoding="utf-8")
+    config = LoadYaml(str(file_path), lazy=True)
+    assert isinstance(config, LazyConfig)
+    assert config.section.key == "value"
+
+
+def test_template_validate_raw():
+    ParentTemplate.validate_raw({"name": "Parent", "nested": {"value": 10}})
+    with pytest.raises(ConfigValidationError) as exc_info:
+        ParentTemplate.validate_raw({"name": "Parent", "nested": {}})
+    assert "In field 'nested': Missing required field: 'value'" in str(exc_info.value)
+
+
+# === Tests for SimpleNamespace conversion ===
+
+
+def test_config_to_namespace():
+    config = Config({"name": "NS", "info": {"age": 3}, "items": [{"key": "value"}, 1]})
+    ns = config.to_namespace()
+    assert ns.name == "NS"
+    assert ns.info.age == 3
+    assert ns.items[0].key == "value"
+    assert ns.items[1] == 1
+    assert not isinstance(ns.info, dict)
+
+
+def test_config_to_namespace_recursive_alias(tmp_path):
+    file_path = tmp_path / "recursive.yaml"
+    file_path.write_text("node: &a\n  self: *a\n  items: [*a]\n", encoding="utf-8")
+    ns = LoadYaml(str(file_path)).to_namespace()
+    assert ns.node.self is ns.node
+    assert ns.node.items[0] is ns.node
+
+
+def test_load_yaml_with_template(tmp_path):
+    file_path = tmp_path / "typed.yaml"
+    data = {"name": "Parent", "nested": {"value": 10}, "extra": {"tags": ["a"]}}
+    file_path.write_text(yaml.dump(data), encoding="utf-8")
+    ns = LoadYaml(str(file_path), template=ParentTemplate)
+    assert ns.name == "Parent"
+    assert ns.nested.value == 10
+    assert ns.extra == {"tags": ["a"]}
+    ns.extra["tags"].append("b")
+    assert LoadYaml(str(file_path)).extra.tags == ["a"]
+
+
+def test_load_json_with_template_invalid(tmp_path):
+    file_path = tmp_path / "typed.json"
+    file_path.write_text(json.dumps({"name": "Parent", "nested": {"value": "x"}}), encoding="utf-8")
+    with pytest.raises(ConfigValidationError):
+        LoadJson(str(file_path), template=ParentTemplate)
+    with pytest.raises(ValueError):
+        LoadJson(str(file_path), lazy=True, template=ParentTemplate)
+
+
+@pytest.mark.parametrize("content", ['"abc"', '["a"]', "[1]"])
+def test_load_json_with_template_not_a_dict(tmp_path, content):
+    file_path = tmp_path / "typed.json"
+    file_path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError) as exc_info:
+        LoadJson(str(file_path), template=ParentTemplate)
+    assert "Config data must be a dictionary" in str(exc_info.value)
+
+
+# === Tests for FrozenConfig ===
+
+
+def test_frozen_config_rejects_modification():
+    config = FrozenConfig({"name": "Frozen", "section": {"items": [1, {"key": "value"}]}})
+    assert isinstance(config.section, FrozenConfig)
+    assert isinstance(config.section["items"], list)
+    assert config.section["items"][1].key == "value"
+    with pytest.raises(TypeError):
+        config.name = "other"
+    with pytest.raises(TypeError):
+        config["name"] = "other"
+    with pytest.raises(TypeError):
+        config.section.update({"a": 1})
+    with pytest.raises(TypeError):
+        config.section["items"].append(2)
+    with pytest.raises(TypeError):
+        del config["name"]
+    mutable = Config(config)
+    mutable.section["items"].append(2)
+    assert type(mutable.section) is Config
+    assert config.section["items"] == [1, {"key": "value"}]
+
+
+def test_frozen_config_copy_and_pickle():
+    import copy
+    import pickle
+
+    config = FrozenConfig({"name": "Frozen", "section": {"items": [1, [2], {"key": "value"}]}})
+    for clone in (copy.copy(config), copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        assert clone == config
+        assert isinstance(clone, FrozenConfig)
+        assert isinstance(clone.section, FrozenConfig)
+        with pytest.raises(TypeError):
+            clone.section["items"].append(3)
+    frozen_list = config.section["items"]
+    assert copy.deepcopy(frozen_list) == frozen_list
+
+
+def test_frozen_config_init_cannot_mutate():
+    config = FrozenConfig({"name": "Frozen", "items": [1]})
+    config.__init__({"name": "Changed", "other": 1})
+    config["items"].__init__([9, 9])
+    assert config == {"name": "Frozen", "items": [1]}
+
+
+def test_load_json_frozen_is_shared(tmp_path):
+    file_path = tmp_path / "frozen.json"
+    file_path.write_text(json.dumps({"name": "Parent", "nested": {"value": 10}}), encoding="utf-8")
+    first = LoadJson(str(file_path), frozen=True)
+    second = LoadJson(str(file_path), frozen=True)
+    assert isinstance(first, FrozenConfig)
+    assert first is second
+    ParentTemplate.validate(first)
+    assert LoadJson(str(file_path)) is not first
+    with pytest.raises(ValueError):
+        LoadJson(str(file_path), frozen=True, lazy=True)
+
+
+def test_load_yaml_frozen(tmp_path):
+    file_path = tmp_path / "frozen.yaml"
+    file_path.write_text(yaml.dump({"list": [1, 2]}), encoding="utf-8")
+    config = LoadYaml(str(file_path), frozen=True)
+    assert config.list == [1, 2]
+    assert LoadYaml(str(file_path), frozen=True) is config
+
+
+def test_load_json_frozen_requires_object(tmp_path):
+    file_path = tmp_path / "array.json"
+    file_path.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        LoadJson(str(file_path), frozen=True)
+
+
+def test_namespace_keeps_non_string_keys(tmp_path):
+    file_path = tmp_path / "intkeys.yaml"
+    file_path.write_text("name: Parent\nnested:\n  value: 1\n1: 2\n", encoding="utf-8")
+    ns = LoadYaml(str(file_path), template=ParentTemplate)
+    assert ns.nested.value == 1
+    assert vars(ns)[1] == 2
+    assert vars(LoadYaml(str(file_path)).to_namespace())[1] == 2
+
+
+def test_template_validate_namespace():
+    ns = Config({"name": "Parent", "nested": {"value": 10}}).to_namespace()
+    ParentTemplate.validate(ns)
+    ns.nested.value = "x"
+    with pytest.raises(ConfigValidationError) as exc_info:
+        ParentTemplate.validate(ns)
+    assert "In field 'nested': Field 'value' expected type 'int', got 'str'" in str(exc_info.value)